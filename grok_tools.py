@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Command-line tools for inspecting the full Grok AI responses stored by the real estate document analyzer.
+Usage: python3 grok_tools.py {quick,list,test,view}
+"""
+
+import argparse
+import sys
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    loads = json.loads
+
+    def dumps_pretty(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+try:
+    from ciso8601 import parse_rfc3339 as parse_timestamp
+except ImportError:
+    def parse_timestamp(value):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+API_BASE = "http://localhost:5000"
+
+def make_session():
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+# Shared keep-alive session so the document list and every per-document
+# fetch reuse the same connection instead of opening a new one each time.
+# All commands go through it from the main thread.
+SESSION = make_session()
+
+# Seconds to wait for the API to accept a connection and to send data
+REQUEST_TIMEOUT = (5, 30)
+
+# Number of characters of the raw response shown in the viewer
+PREVIEW_CHARS = 2000
+
+# Grok responses fetched during this session, keyed by document id
+CACHE = {}
+
+# Background fetches started while the user is choosing the next document.
+# They run on daemon threads, so quitting never waits for one, and use their
+# own session because requests.Session isn't guaranteed to be thread-safe.
+PREFETCH = {}
+PREFETCH_SESSION = make_session()
+PREFETCH_LOCK = threading.Lock()
+
+def save_json(filename, obj):
+    """Serialise obj in a single pass, then write it out with one call"""
+    payload = dumps_pretty(obj)
+    with open(filename, 'wb') as f:
+        f.write(payload)
+
+def format_tokens(tokens):
+    return f"{tokens:,}" if tokens else "N/A"
+
+def format_time(ms):
+    if not ms:
+        return "N/A"
+    return f"{ms}ms" if ms < 1000 else f"{ms/1000:.1f}s"
+
+def fetch_documents(status=None):
+    """Request the document list from the API, optionally filtered by status, raising on failure"""
+    params = {'status': status} if status else None
+    response = SESSION.get(f"{API_BASE}/api/documents", params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return loads(response.content)
+
+def get_documents():
+    """Get all documents from the API"""
+    try:
+        return fetch_documents()
+    except Exception as e:
+        print(f"Error fetching documents: {e}")
+        return []
+
+def fetch_grok_response(doc_id, full=False, session=SESSION):
+    """Request the Grok response for a specific document, raising on failure.
+
+    Unless full is set only the server's summary projection is requested,
+    which carries everything the viewer displays.
+    """
+    params = None if full else {'projection': 'summary'}
+    response = session.get(f"{API_BASE}/api/documents/{doc_id}/grok-response",
+                           params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return loads(response.content)
+
+def get_grok_response(doc_id, full=False):
+    """Get the Grok response for a specific document.
+
+    Results are cached, so viewing a document again doesn't repeat the
+    request, and a prefetch already in flight is reused.
+    """
+    cached = CACHE.get(doc_id)
+    if cached is not None and not (full and is_summary(cached)):
+        return cached
+    future = PREFETCH.pop(doc_id, None)
+    try:
+        if future is not None and not full:
+            grok_data = future.result()
+        else:
+            grok_data = fetch_grok_response(doc_id, full)
+    except Exception as e:
+        print(f"Error fetching Grok response: {e}")
+        return None
+    CACHE[doc_id] = grok_data
+    return grok_data
+
+def run_prefetch(future, doc_id):
+    try:
+        with PREFETCH_LOCK:
+            grok_data = fetch_grok_response(doc_id, session=PREFETCH_SESSION)
+    except Exception as e:
+        future.set_exception(e)
+    else:
+        future.set_result(grok_data)
+
+def prefetch_grok_response(doc_id):
+    """Start fetching a document's Grok response in the background"""
+    if doc_id not in CACHE and doc_id not in PREFETCH:
+        future = Future()
+        PREFETCH[doc_id] = future
+        threading.Thread(target=run_prefetch, args=(future, doc_id), daemon=True).start()
+
+def list_raw_data(doc):
+    """Return the rawExtractedData of a document list entry, where the full Grok response is stored"""
+    return (doc.get('propertyData') or {}).get('rawExtractedData') or {}
+
+def grok_data_from_list(doc):
+    """Build the grok-response payload from a document list entry, if it already carries one"""
+    raw_data = list_raw_data(doc)
+    gr = raw_data.get('fullGrokResponse')
+    if not gr or 'full_response_content' not in gr:
+        return None
+    return {
+        'document': {
+            'id': doc['id'],
+            'originalName': doc['originalName'],
+            'status': doc['status'],
+        },
+        'fullGrokResponse': gr,
+        'grokModelUsed': gr.get('model'),
+        'grokTokensUsed': raw_data.get('tokensUsed') or gr.get('total_tokens'),
+        'grokProcessingTime': raw_data.get('processingTime') or gr.get('response_time_ms'),
+    }
+
+def is_summary(grok_data):
+    return 'full_response_length' in grok_data['fullGrokResponse']
+
+def display_document_list(documents):
+    """Display list of available documents"""
+    lines = [
+        "=" * 80,
+        "AVAILABLE DOCUMENTS WITH GROK RESPONSES",
+        "=" * 80,
+    ]
+    
+    grok_docs = []
+    for i, doc in enumerate(documents, 1):
+        has_grok = list_raw_data(doc).get('fullGrokResponse') is not None
+        if has_grok:
+            grok_docs.append(doc)
+            lines.append(f"{len(grok_docs)}. {doc['originalName']}")
+            lines.append(f"   Status: {doc['status']}")
+            lines.append(f"   Uploaded: {parse_timestamp(doc['uploadedAt']).strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append("")
+    
+    if not grok_docs:
+        lines.append("No documents with Grok responses found.")
+        lines.append("Upload a PDF document to generate Grok analysis data.")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return grok_docs
+
+def display_grok_response(grok_data):
+    """Display full Grok response data"""
+    doc = grok_data['document']
+    gr = grok_data['fullGrokResponse']
+    pr = gr.get('parsed_result') or {}
+    dc = pr.get('documentClassification') or {}
+    raw_content = gr.get('full_response_content') or ''
+    raw_size = gr.get('full_response_length', len(raw_content))
+    
+    lines = [
+        "=" * 80,
+        f"FULL GROK RESPONSE: {doc['originalName']}",
+        "=" * 80,
+    ]
+    
+    # Metrics
+    lines.append("📊 PROCESSING METRICS:")
+    lines.append(f"   Model: {gr.get('model', 'Unknown')}")
+    lines.append(f"   Prompt Tokens: {format_tokens(gr.get('prompt_tokens'))}")
+    lines.append(f"   Completion Tokens: {format_tokens(gr.get('completion_tokens'))}")
+    lines.append(f"   Total Tokens: {format_tokens(gr.get('total_tokens'))}")
+    lines.append(f"   Processing Time: {format_time(gr.get('response_time_ms'))}")
+    lines.append(f"   Response Size: {raw_size:,} characters")
+    lines.append(f"   Timestamp: {gr.get('timestamp', 'N/A')}")
+    lines.append("")
+    
+    # Document Classification
+    if dc:
+        lines.append("📋 DOCUMENT CLASSIFICATION:")
+        lines.append(f"   Type: {dc.get('documentType', 'N/A')}")
+        lines.append(f"   Subtype: {dc.get('documentSubtype', 'N/A')}")
+        lines.append("")
+    
+    # Raw Response Content
+    lines.append("📄 RAW GROK RESPONSE CONTENT:")
+    lines.append("-" * 80)
+    if not raw_content:
+        lines.append("No raw content available")
+    elif raw_size > PREVIEW_CHARS:
+        # A summary only carries the start of a large response, so show that
+        # as plain text whether this document was fetched in full or not
+        lines.append(raw_content[:PREVIEW_CHARS])
+        lines.append(f"\n... (truncated, full content is {raw_size:,} chars)")
+    else:
+        try:
+            # The whole response fits in the preview; pretty print it if it's JSON
+            lines.append(dumps_pretty(loads(raw_content)).decode('utf-8'))
+        except ValueError:
+            lines.append(raw_content)
+    lines.append("-" * 80)
+    lines.append("")
+    
+    # Emit the whole report with one write rather than a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def cmd_quick():
+    """Show a short summary of the Grok response for every processed document"""
+    try:
+        # Only completed documents have a Grok response, so let the server
+        # filter the list rather than parsing every unprocessed document
+        docs = fetch_documents(status='completed')
+        
+        if not docs:
+            print("No processed documents found. Upload a PDF first.")
+            return
+            
+        print(f"Found {len(docs)} processed document(s)")
+        
+        for doc in docs:
+            print(f"\n📄 Document: {doc['originalName']}")
+            print(f"   Status: {doc['status']}")
+            
+            # Fetch a summary of the Grok response (metrics and a content preview)
+            try:
+                grok_resp = SESSION.get(
+                    f"{API_BASE}/api/documents/{doc['id']}/grok-response",
+                    params={'projection': 'summary'},
+                    timeout=REQUEST_TIMEOUT,
+                )
+                
+                if grok_resp.status_code == 200:
+                    data = loads(grok_resp.content)
+                    gr = data['fullGrokResponse']
+                    pr = gr.get('parsed_result') or {}
+                    dc = pr.get('documentClassification') or {}
+                    raw = gr.get('full_response_content') or ''
+                    
+                    print(f"   ✅ Full Grok Response Available!")
+                    print(f"   Model: {gr.get('model', 'Unknown')}")
+                    print(f"   Tokens: {gr.get('total_tokens', 0):,}")
+                    print(f"   Processing Time: {gr.get('response_time_ms', 0)/1000:.1f}s")
+                    
+                    # Show first part of raw response
+                    if raw:
+                        print(f"\n   🔍 RAW GROK RESPONSE (first 300 chars):")
+                        print(f"   {raw[:300]}...")
+                        
+                    # Show parsed classification
+                    if dc:
+                        print(f"\n   📋 Document Classification:")
+                        print(f"   Type: {dc.get('documentType', 'N/A')}")
+                        print(f"   Subtype: {dc.get('documentSubtype', 'N/A')}")
+                        
+                else:
+                    print(f"   ❌ No Grok response: {grok_resp.status_code}")
+                    
+            except Exception as e:
+                print(f"   ❌ Error accessing Grok response: {e}")
+                
+    except Exception as e:
+        print(f"Error: {e}")
+
+def process_doc(i, doc):
+    """Summarise one document and save its Grok response, returning the lines to print"""
+    lines = [
+        f"\n{i}. Document: {doc['originalName']}",
+        f"   ID: {doc['id']}",
+        f"   Status: {doc['status']}",
+        f"   Uploaded: {doc['uploadedAt']}",
+    ]
+    
+    if not (doc.get('propertyData') and doc['propertyData'].get('rawExtractedData')):
+        lines.append(f"   ❌ No processed data")
+        return lines, False
+    
+    raw_data = doc['propertyData']['rawExtractedData']
+    if not raw_data.get('fullGrokResponse'):
+        lines.append(f"   ❌ No Grok response")
+        return lines, False
+    
+    gr = raw_data['fullGrokResponse']
+    pr = gr.get('parsed_result') or {}
+    dc = pr.get('documentClassification') or {}
+    raw_content = gr.get('full_response_content') or ''
+    
+    lines.append(f"   ✅ FULL GROK RESPONSE AVAILABLE")
+    lines.append(f"   Model: {gr.get('model', 'Unknown')}")
+    lines.append(f"   Tokens: {gr.get('total_tokens', 0):,}")
+    lines.append(f"   Time: {gr.get('response_time_ms', 0)/1000:.1f}s")
+    
+    # Document classification
+    if dc:
+        lines.append(f"   Type: {dc.get('documentType', 'N/A')}")
+        lines.append(f"   Subtype: {dc.get('documentSubtype', 'N/A')}")
+    
+    # Show sample of raw response
+    if raw_content:
+        lines.append(f"   Raw response: {len(raw_content):,} chars")
+        lines.append(f"   Sample: {raw_content[:100]}...")
+        
+        # Save each response to a separate file
+        filename = f"grok_response_{doc['id'][:8]}.json"
+        save_json(filename, gr)
+        lines.append(f"   Saved to: {filename}")
+    
+    return lines, True
+
+def cmd_list():
+    """Summarise every document and save each full Grok response to a file"""
+    try:
+        # Get all documents
+        documents = fetch_documents()
+        
+        if not documents:
+            print("No documents found")
+            return
+            
+        print(f"Found {len(documents)} document(s)")
+        print("=" * 60)
+        
+        grok_count = 0
+        
+        _write = sys.stdout.write
+        for i, doc in enumerate(documents, 1):
+            lines, has_grok = process_doc(i, doc)
+            _write("\n".join(lines) + "\n")
+            if has_grok:
+                grok_count += 1
+        
+        print(f"\n" + "=" * 60)
+        print(f"SUMMARY: {grok_count} document(s) with full Grok responses available")
+        
+        if grok_count > 0:
+            print("\nYou can now:")
+            print("1. Read the JSON files saved above for complete responses")
+            print("2. Use this script anytime to check all documents")
+            print("3. Access raw response content for analysis")
+        else:
+            print("\nNo Grok responses found. Upload and process documents first.")
+            
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+def cmd_test():
+    """Check that the first document's full Grok response is accessible and save it"""
+    try:
+        documents = fetch_documents()
+        
+        if not documents:
+            print("No documents found")
+            return
+            
+        doc = documents[0]
+        print(f"Document: {doc['originalName']}")
+        print(f"Status: {doc['status']}")
+        print(f"ID: {doc['id']}")
+        
+        if doc.get('propertyData') and doc['propertyData'].get('rawExtractedData'):
+            raw_data = doc['propertyData']['rawExtractedData']
+            
+            if raw_data.get('fullGrokResponse'):
+                gr = raw_data['fullGrokResponse']
+                pr = gr.get('parsed_result') or {}
+                dc = pr.get('documentClassification') or {}
+                raw_content = gr.get('full_response_content') or ''
+                print("\n✅ FULL GROK RESPONSE FOUND!")
+                print("=" * 50)
+                print(f"Model: {gr.get('model', 'Unknown')}")
+                print(f"Total Tokens: {gr.get('total_tokens', 0):,}")
+                print(f"Processing Time: {gr.get('response_time_ms', 0)/1000:.1f}s")
+                print(f"Timestamp: {gr.get('timestamp', 'N/A')}")
+                
+                # Show raw response content
+                print(f"\n📄 Raw Response Length: {len(raw_content):,} characters")
+                print("First 500 characters:")
+                print("-" * 50)
+                print(raw_content[:500])
+                print("-" * 50)
+                
+                # Show document classification
+                if dc:
+                    print(f"\n📋 Document Classification:")
+                    print(f"Type: {dc.get('documentType', 'N/A')}")
+                    print(f"Subtype: {dc.get('documentSubtype', 'N/A')}")
+                
+                print("\n🎯 SUCCESS: Full Grok response is accessible!")
+                
+                # Save to file for analysis
+                save_json('latest_grok_response.json', gr)
+                print("Saved full response to 'latest_grok_response.json'")
+                
+            else:
+                print("❌ No fullGrokResponse found in raw data")
+                print("Available keys:", list(raw_data.keys()))
+        else:
+            print("❌ No property data or raw extracted data found")
+            
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+def cmd_view():
+    """Interactively browse documents and their full Grok responses"""
+    print("Real Estate Document Analyzer - Grok Response Viewer")
+    print("=" * 60)
+    
+    # Get all documents
+    documents = get_documents()
+    if not documents:
+        print("No documents found.")
+        return
+    
+    # Show documents with Grok responses
+    grok_docs = display_document_list(documents)
+    if not grok_docs:
+        return
+    
+    # The document list already includes each full Grok response, so seed the
+    # cache from it; the per-document endpoint (and the prefetch below) is only
+    # used for entries that arrive without the response content
+    for doc in grok_docs:
+        grok_data = grok_data_from_list(doc)
+        if grok_data:
+            CACHE[doc['id']] = grok_data
+    
+    # Let user select a document
+    while True:
+        try:
+            choice = input(f"\nSelect document (1-{len(grok_docs)}) or 'q' to quit: ").strip()
+            if choice.lower() == 'q':
+                break
+            
+            doc_num = int(choice)
+            if 1 <= doc_num <= len(grok_docs):
+                selected_doc = grok_docs[doc_num - 1]
+                
+                # Get full Grok response
+                grok_data = get_grok_response(selected_doc['id'])
+                if grok_data:
+                    display_grok_response(grok_data)
+                    
+                    # Fetch the next document while the user decides
+                    prefetch_grok_response(grok_docs[doc_num % len(grok_docs)]['id'])
+                    
+                    # Ask if user wants to save to file
+                    save = input("\nSave full response to file? (y/n): ").strip().lower()
+                    if save == 'y':
+                        if is_summary(grok_data):
+                            grok_data = get_grok_response(selected_doc['id'], full=True)
+                        if grok_data:
+                            filename = f"grok_response_{selected_doc['id'][:8]}.json"
+                            save_json(filename, grok_data)
+                            print(f"Saved to {filename}")
+                else:
+                    print("Failed to retrieve Grok response.")
+            else:
+                print("Invalid selection.")
+        except (ValueError, KeyboardInterrupt):
+            break
+    
+    print("\nGoodbye!")
+
+COMMANDS = {
+    'quick': (cmd_quick, "show a short summary of every processed document's Grok response"),
+    'list': (cmd_list, "summarise all documents and save each Grok response to a file"),
+    'test': (cmd_test, "check the first document's Grok response and save it"),
+    'view': (cmd_view, "interactively browse the full Grok responses"),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect the full Grok responses stored by the document analyzer.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (func, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text).set_defaults(func=func)
+    args = parser.parse_args(argv)
+    args.func()
+
+if __name__ == "__main__":
+    main()
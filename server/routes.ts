@@ -42,6 +42,28 @@ const upload = multer({
   },
 });
 
+const GROK_SUMMARY_PREVIEW_CHARS = 2000;
+
+function summarizeGrokResponse(fullGrokResponse: any) {
+  // Measure and cut by code points, not UTF-16 units, so a preview can't end
+  // in half a surrogate pair and the length matches Python's len()
+  const content: string = fullGrokResponse.full_response_content || "";
+  const chars = Array.from(content);
+  return {
+    model: fullGrokResponse.model,
+    prompt_tokens: fullGrokResponse.prompt_tokens,
+    completion_tokens: fullGrokResponse.completion_tokens,
+    total_tokens: fullGrokResponse.total_tokens,
+    response_time_ms: fullGrokResponse.response_time_ms,
+    timestamp: fullGrokResponse.timestamp,
+    full_response_content: chars.slice(0, GROK_SUMMARY_PREVIEW_CHARS).join(""),
+    full_response_length: chars.length,
+    parsed_result: {
+      documentClassification: fullGrokResponse.parsed_result?.documentClassification,
+    },
+  };
+}
+
 export async function registerRoutes(app: Express): Promise<Server> {
   // Properties routes
   app.get("/api/properties", async (req, res) => {
@@ -91,10 +113,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
-  // Get all documents
+  // Get all documents, optionally only those with a given ?status=
   app.get("/api/documents", async (req, res) => {
     try {
-      const documents = await storage.getDocumentsWithData();
+      const status = typeof req.query.status === "string" ? req.query.status : undefined;
+      const documents = await storage.getDocumentsWithData(status);
       res.json(documents);
     } catch (error) {
       res.status(500).json({ message: "Failed to fetch documents" });
@@ -174,13 +197,20 @@ export async function registerRoutes(app: Express): Promise<Server> {
         return res.status(404).json({ error: "No Grok response found for this document" });
       }
 
+      // ?projection=summary returns only the metrics, the document
+      // classification and a preview of the raw content, so clients that
+      // just print a summary don't download the whole response
+      const fullGrokResponse = req.query.projection === "summary"
+        ? summarizeGrokResponse(rawData.fullGrokResponse)
+        : rawData.fullGrokResponse;
+
       res.json({
         document: {
           id: document.id,
           originalName: document.originalName,
           status: document.status
         },
-        fullGrokResponse: rawData.fullGrokResponse,
+        fullGrokResponse,
         grokModelUsed: rawData.fullGrokResponse.model,
         grokTokensUsed: rawData.tokensUsed || rawData.fullGrokResponse.total_tokens,
         grokProcessingTime: rawData.processingTime || rawData.fullGrokResponse.response_time_ms
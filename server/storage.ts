@@ -22,7 +22,7 @@ export interface IStorage {
   createPropertyData(propertyData: InsertPropertyData): Promise<PropertyData>;
   getPropertyDataByDocumentId(documentId: string): Promise<PropertyData | undefined>;
   getAllPropertyData(): Promise<PropertyData[]>;
-  getDocumentsWithData(): Promise<DocumentWithData[]>;
+  getDocumentsWithData(status?: string): Promise<DocumentWithData[]>;
 }
 
 export class MemStorage implements IStorage {
@@ -188,8 +188,9 @@ export class MemStorage implements IStorage {
     );
   }
 
-  async getDocumentsWithData(): Promise<DocumentWithData[]> {
-    const documents = await this.getAllDocuments();
+  async getDocumentsWithData(status?: string): Promise<DocumentWithData[]> {
+    const allDocuments = await this.getAllDocuments();
+    const documents = status ? allDocuments.filter(doc => doc.status === status) : allDocuments;
     return documents.map(doc => ({
       ...doc,
       propertyData: Array.from(this.propertyData.values()).find(